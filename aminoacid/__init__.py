@@ -2,51 +2,37 @@
 from __future__ import annotations
 
 import asyncio
-from functools import wraps
+from functools import cached_property, wraps
 from importlib.util import find_spec
-from logging import Logger, getLogger
+from logging import INFO, Logger, getLogger
 from secrets import token_urlsafe
-from shlex import split
 from time import asctime
-from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar
+from weakref import WeakValueDictionary
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, TCPConnector
 
 from ._socket import SocketClient
-from .abc import _ORJSON, Context, Message, Session, User, json
+from .abc import (
+    Context,
+    Message,
+    Session,
+    Thread,
+    User,
+    json_bytes,
+    json_serialize,
+)
 from .client import ApiClient
 from .exceptions import AminoBaseException, CommandExists, CommandNotFound
-from .util import HelpCommand, UserCommand, __version__, get_headers
+from .util import HelpCommand, UserCommand, __version__, get_headers, get_signature
 
 __author__ = "okok7711"
 
 _COLOR = find_spec("coloredlogs")
-
-if _COLOR:
-    import coloredlogs
-
-    coloredlogs.install()
+_UVLOOP = find_spec("uvloop")
 
 T = TypeVar("T")
 
-json_serialize = (
-    lambda obj, *args, **kwargs: json.dumps(obj).decode()
-    if _ORJSON
-    else json.dumps(obj)
-)
-"""Function to serialize data with ORJson if its installed, uses built in json module if not
-
-Parameters
-----------
-obj : dict
-    object to serialize
-        
-Returns
--------
-str
-    serialized json data
-"""
-
 
 class Bot(ApiClient):
     r"""Bot client class, this is the interface for doing anything
@@ -65,33 +51,72 @@ class Bot(ApiClient):
         The version of the signing algorithm. This is currently \x42
     sessionId : str, optional
         If given, the bot will not auth via login but will use the given session instead
+    color_logs : bool, optional
+        Whether to install coloredlogs if it's available, by default True
+    use_uvloop : bool, optional
+        Whether to set uvloop's event loop policy if it's available, by default True.
+        The policy applies to the whole process, pass False when the bot runs in a loop that is managed elsewhere
     """
+
     loop: asyncio.AbstractEventLoop
     profile: User
 
     def __init__(
-        self, prefix: str = "/", *, help_command: Optional[UserCommand] = None, **kwargs
+        self,
+        prefix: str = "/",
+        *,
+        help_command: Optional[UserCommand] = None,
+        color_logs: bool = True,
+        use_uvloop: bool = True,
+        **kwargs,
     ) -> None:
         self.prefix = prefix
         self.__command_map__: Dict[str, UserCommand] = {
             "help": help_command or HelpCommand()
         }
+        self._help_listing: Optional[str] = None
+        """Command listing sent by `HelpCommand`, reset whenever a command is added or removed or the prefix changes"""
         self.events: Dict[str, Callable[..., Coroutine[Any, Any, T]]] = {}
+        self._threads: WeakValueDictionary[Tuple[int, str], Thread] = (
+            WeakValueDictionary()
+        )
+        """`Thread` objects shared by the messages sent in them, keyed by (ndcId, threadId)"""
         self.logger = getLogger(__name__)
+        if color_logs and _COLOR:
+            import coloredlogs
+
+            coloredlogs.install()
+        if use_uvloop and _UVLOOP:
+            # * The policy has to be set before the HttpClient binds itself to a loop
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         self._http = HttpClient(logger=self.logger, **kwargs)
 
         super().__init__()
 
+    @property
+    def prefix(self) -> str:
+        """The prefix the bot listens to, setting it also updates the cached prefix length and help listing"""
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._prefix_len = len(prefix)
+        self._help_listing = None
+
     def unregister_command(self, name: str):
         if not self.__command_map__.pop(name, ""):
             raise CommandNotFound(name)
+        self._help_listing = None
 
     def command(
         self,
         name="",
         *,
-        check: Optional[Callable[[Context], bool]] = lambda _: True,
-        check_any: Optional[List[Callable[[Context], bool]]] = [],
+        check: Optional[Callable[[Context], bool]] = None,
+        check_any: Optional[List[Callable[[Context], bool]]] = None,
         cooldown: Optional[int] = 0,
     ):
         """Wrapper to register commands to the bot
@@ -101,9 +126,9 @@ class Bot(ApiClient):
         name : str, optional
             Name that the command should listen on, by default the name of the function
         check : Optional[Callable[[Context], bool]], optional
-            function to check whether the command may be executed, by default always returns True
+            function to check whether the command may be executed, by default None (no check)
         check_any : Optional[List[Callable[[Context], bool]]], optional
-            list of checks of which any need to pass, by default []
+            list of checks of which any need to pass, by default None (no checks)
         cooldown : Optional[int], optional
             cooldown before someone can use the command again, by default 0
 
@@ -118,15 +143,16 @@ class Bot(ApiClient):
             def func() -> UserCommand:
                 if (name or f.__name__) in self.__command_map__:
                     return self.logger.exception(CommandExists(name))
-                self.__command_map__[name or f.__name__] = (
-                    cmd := UserCommand(
-                        func=f,
-                        command_name=name,
-                        check=check,
-                        check_any=check_any,
-                        cooldown=cooldown,
-                    )
+                cmd = UserCommand(
+                    func=f,
+                    command_name=name,
+                    check=check,
+                    check_any=check_any,
+                    cooldown=cooldown,
                 )
+                # * The interned name is used as the key so lookups can match it by identity
+                self.__command_map__[cmd.name] = cmd
+                self._help_listing = None
                 return cmd
 
             return func()
@@ -149,6 +175,8 @@ class Bot(ApiClient):
                 if (name or f.__name__) in self.events:
                     return
                 self.events[name or f.__name__] = f
+                if socket := getattr(self, "socket", None):
+                    socket.update_events()
 
             return func()
 
@@ -210,16 +238,23 @@ class Bot(ApiClient):
             await self.cleanup_loop()
 
     async def handle_command(self, message: Message):
-        """Handles a command for the supplied message
+        """Handles a command for the supplied message, the message has to start with `self.prefix`
 
         Parameters
         ----------
         message : Message
             The message to handle
         """
-        if not message.startswith(self.prefix):
+        rest = message.content[self._prefix_len :]
+        # * Only fall back to shlex when the arguments are actually quoted
+        if '"' in rest or "'" in rest:
+            from shlex import split
+
+            args = split(rest)
+        else:
+            args = rest.split()
+        if not args:
             return
-        args = split(message.content[len(self.prefix) :])
         if args[0] in self.__command_map__:
             coro = (cmd := self.__command_map__[args.pop(0)])(
                 (ctx := Context(client=self, message=message)), *args
@@ -238,26 +273,56 @@ class Bot(ApiClient):
     async def cleanup_loop(self):
         """Cleans up, closes sessions, etc."""
         # TODO: maybe make better cleanup
+        if socket := getattr(self, "socket", None):
+            await socket.stop()
         await self._http.close()
 
 
 class HttpClient(ClientSession):
-    session: Session
+    __slots__ = ("base", "key", "device", "v", "logger", "_session", "_header_template")
 
     def __init__(self, logger: Logger, *args, **kwargs) -> None:
         self.base: str = kwargs.pop("base_uri", "https://service.narvii.com/api/v1")
         self.key: bytes = kwargs.pop("key")
         self.device: str = kwargs.pop("device")
         self.v: bytes = kwargs.pop("v", b"\x42")
-        self.token: str = token_urlsafe(152)
-        """pushToken for notification sending, randomly generated"""
 
         self.logger = logger
 
+        self._header_template: Dict[str, str] = get_headers(device=self.device)
+        """Headers sent with every request, the signature is added per request"""
         self.session = None
 
+        if "connector" not in kwargs:
+            # * Every request goes to the same host, so keep its connections and DNS entry around
+            kwargs["connector"] = TCPConnector(
+                limit=0,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+
         super().__init__(*args, **kwargs, json_serialize=json_serialize)
 
+    @cached_property
+    def token(self) -> str:
+        """pushToken for notification sending, randomly generated on first use"""
+        return token_urlsafe(152)
+
+    @property
+    def session(self) -> Optional[Session]:
+        """The `Session` used to authenticate requests, setting it also updates the NDCAUTH header"""
+        return self._session
+
+    @session.setter
+    def session(self, session: Optional[Session]) -> None:
+        self._session = session
+        if session:
+            self._header_template["NDCAUTH"] = session.sid
+        else:
+            self._header_template.pop("NDCAUTH", None)
+
     async def request(self, method: str, url: str, *args, **kwargs) -> ClientResponse:
         """Execute a request
 
@@ -274,14 +339,18 @@ class HttpClient(ClientSession):
             Response the server returned
         """
 
-        headers = kwargs.pop("headers", {}) or get_headers(
-            data=json_serialize(kwargs.get("json", {})).encode(),
-            device=self.device,
-            key=self.key,
-            v=self.v,
-        )
-        if self.session:
+        body = kwargs.pop("json", None)
+        data = json_bytes({} if body is None else body)
+        headers = kwargs.pop("headers", {})
+        if not headers:
+            headers = self._header_template.copy()
+            headers["NDC-MSG-SIG"] = get_signature(data, self.key, self.v)
+        elif self.session:
             headers["NDCAUTH"] = self.session.sid
+        if body is not None:
+            # * The body is sent as the exact bytes that were signed
+            kwargs["data"] = data
+            headers["Content-Type"] = "application/json"
         response = await super().request(
             method,
             url=(self.base + url if not "wss" in url else url),
@@ -294,14 +363,23 @@ class HttpClient(ClientSession):
 
     @staticmethod
     async def log_request(response: ClientResponse, logger: Logger) -> None:
-        """Logs a request and its response with info level
+        """Logs a request and its response with info level, nothing is read if the logger would discard the record
 
         Parameters
         ----------
         response : ClientResponse
             the response object that the request returned
         """
+        if not logger.isEnabledFor(INFO):
+            return
         logger.info(
-            f"{response.request_info.method} [{asctime()}] -> {response.url}: {response.status} [{response.content_type}] "
-            f"Received Headers: {response.headers}, Sent Headers: {response.request_info.headers}, Received Content: {await response.text()}"
+            "%s [%s] -> %s: %s [%s] Received Headers: %s, Sent Headers: %s, Received Content: %s",
+            response.request_info.method,
+            asctime(),
+            response.url,
+            response.status,
+            response.content_type,
+            response.headers,
+            response.request_info.headers,
+            await response.text(),
         )
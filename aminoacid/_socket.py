@@ -1,29 +1,90 @@
 from __future__ import annotations
 
 import asyncio
+from itertools import count
+from logging import INFO
 from random import randint
 from time import asctime, time
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
 
-from aiohttp import ClientConnectorError, ClientWebSocketResponse
+from aiohttp import ClientConnectorError, ClientWebSocketResponse, WSMsgType
 
-from .abc import Message, Notification
-from .util import __version__, get_headers, parse_topic
+from .abc import Message, Notification, _loads, json_serialize
+from .util import __version__, get_signature, now_ms, parse_topic
 from .util.enums import MessageTypes, NotifTypes, SocketCodes, Topics
 from .util.events import empty_cb
 
 if TYPE_CHECKING:
     from . import Bot
 
+_DATA_TYPES = (WSMsgType.TEXT, WSMsgType.BINARY)
+_CLOSING_TYPES = (
+    WSMsgType.CLOSE,
+    WSMsgType.CLOSING,
+    WSMsgType.CLOSED,
+    WSMsgType.ERROR,
+)
+
+_NOTIF_EVENTS = MappingProxyType(
+    {
+        NotifTypes.INVITE_VC.value: "on_vc_invite",
+        NotifTypes.START_VC.value: "on_vc_start",
+        NotifTypes.MESSAGE.value: "on_notification",
+    }
+)
+"""Maps notification types to the name of the event they trigger"""
+_TOPIC_EVENTS = MappingProxyType(
+    {
+        Topics.START_TYPING.value: "on_start_typing",
+        Topics.END_TYPING.value: "on_end_typing",
+        Topics.START_RECODING.value: "on_start_recording",
+        Topics.END_RECORDING.value: "on_end_recording",
+        Topics.ONLINE_MEMBERS.value: "on_online_members",
+    }
+)
+"""Maps livelayer topics to the name of the event they trigger"""
+
 
 class SocketClient:
     """Client for the Amino WebSocket, this receives messages and handles them accordingly"""
 
+    __slots__ = (
+        "client",
+        "http",
+        "socket",
+        "_on_notification",
+        "_on_livelayer",
+        "_notif_dispatch",
+        "_topic_dispatch",
+        "_acks",
+        "_ack_task",
+        "_send_ids",
+    )
+
     socket: ClientWebSocketResponse
 
     def __init__(self, client: Bot) -> None:
         self.client = client
         self.http = client._http
+        self._acks: asyncio.Queue = asyncio.Queue()
+        self._ack_task: Optional[asyncio.Task] = None
+        self._send_ids = count(int(time()) % 86400)
+        self.update_events()
+
+    def update_events(self):
+        """Resolves the callbacks used to dispatch notifications and livelayer events,
+        this is called by `aminoacid.Bot.event()` whenever a new event is registered
+        """
+        events = self.client.events
+        self._on_notification = events.get("on_notification", empty_cb)
+        self._on_livelayer = events.get("on_livelayer", empty_cb)
+        self._notif_dispatch = {
+            code: events.get(name, empty_cb) for code, name in _NOTIF_EVENTS.items()
+        }
+        self._topic_dispatch = {
+            topic: events.get(name, empty_cb) for topic, name in _TOPIC_EVENTS.items()
+        }
 
     async def run_loop(self):
         """Runs the socket and reconnects every 360 seconds to maintain socket connection"""
@@ -33,19 +94,43 @@ class SocketClient:
             await asyncio.sleep(360)
             await self.reconnect()
 
+    async def stop(self):
+        """Stops the ACK writer and closes the socket if it's open"""
+        if self._ack_task is not None:
+            self._ack_task.cancel()
+            self._ack_task = None
+        socket = getattr(self, "socket", None)
+        if socket is not None and not socket.closed:
+            await socket.close()
+
+    def _start_ack_writer(self):
+        """Starts the ACK writer task if it isn't running yet or has stopped"""
+        if self._ack_task is None or self._ack_task.done():
+            self._ack_task = asyncio.create_task(self._ack_writer())
+
+    async def _ack_writer(self):
+        """Sends the queued message ACKs, this runs as a task so the receive loop never waits on a write"""
+        while True:
+            code, obj = await self._acks.get()
+            try:
+                await self.send(code, obj)
+            except ConnectionError as exc:
+                self.client.logger.warning("Dropped message ACK: %s", exc)
+            except Exception:
+                # * Keep the writer alive, otherwise every later ACK would be lost
+                self.client.logger.exception("Failed to send message ACK")
+
     async def reconnect(self):
         """Reconnects socket, opens the socket if it didn't open once"""
-        if not self.socket.closed:
-            await self.socket.close()
-        del self.socket
+        socket = getattr(self, "socket", None)
+        if socket is not None and not socket.closed:
+            await socket.close()
         await self.run()
 
     async def run(self):
         """Connects to the socket and runs the message handling loop"""
-        sign = f"{self.http.device}|{int(time()*1000)}"
-        sig = get_headers(data=sign.encode(), key=self.http.key, v=self.http.v)[
-            "NDC-MSG-SIG"
-        ]
+        sign = f"{self.http.device}|{now_ms()}"
+        sig = get_signature(sign.encode(), self.http.key, self.http.v)
         try:
             self.socket = await self.http.ws_connect(
                 url=f"wss://ws{randint(1, 4)}.narvii.com/?signbody={sign}",
@@ -58,15 +143,19 @@ class SocketClient:
             )
         except ClientConnectorError as exp:
             self.client.logger.exception(
-                f"[{asctime()}] Encountered ClientConnectorError while trying to connect to socket: {exp.strerror}"
+                "[%s] Encountered ClientConnectorError while trying to connect to socket: %s",
+                asctime(),
+                exp.strerror,
             )
             await asyncio.sleep(1)
             return await self.run()
-        await (self.client.events.get("on_ready", empty_cb)())
+        self._start_ack_writer()
+        if (on_ready := self.client.events.get("on_ready")) is not None:
+            await on_ready()
         await self.sock_conn()
 
     async def handle_message(self, message: Message):
-        """Handles received messages
+        """Handles received messages, messages sent by the bot itself are ignored
         If it starts with the set prefix, it will handle as command, otherwise it will handle through the on_message event
 
         Parameters
@@ -74,17 +163,17 @@ class SocketClient:
         message : Message
             The message that was received by the socket to handle
         """
-        if message.type == MessageTypes.TEXT:
-            if not message.startswith(self.client.prefix):
-                await (self.client.events.get("on_message", empty_cb)(message))
-            else:
-                # * Don't handle messages that the bot sends
-                if message.author.id == self.client.profile.id:
-                    return
-                await self.client.handle_command(message)
-        else:
+        # * Don't handle messages that the bot sends
+        if message.author_id == self.client.profile.id:
+            return
+        if message.type != MessageTypes.TEXT:
             # TODO: Implement other messageTypes
-            ...
+            return
+        if message.startswith(self.client.prefix):
+            await self.client.handle_command(message)
+        else:
+            if (on_message := self.client.events.get("on_message")) is not None:
+                await on_message(message)
 
     async def handle_notification(self, notification: Notification):
         """Handles received notifications
@@ -95,16 +184,10 @@ class SocketClient:
         notification : Notification
             the notification that was received by the socket to handle
         """
-        _events = {
-            NotifTypes.INVITE_VC.value: "on_vc_invite",
-            NotifTypes.START_VC.value: "on_vc_start",
-            NotifTypes.MESSAGE.value: "on_notification",
-        }
-        await (
-            self.client.events.get(
-                _events.get(notification.type, "on_notification"), empty_cb
-            )(notification)
-        )
+        # * Nothing is awaited for notifications the bot doesn't listen to
+        callback = self._notif_dispatch.get(notification.type, self._on_notification)
+        if callback is not empty_cb:
+            await callback(notification)
 
     async def handle_livelayer(self, event: dict):
         """Events that are handled by the livelayer are handled by this
@@ -116,56 +199,67 @@ class SocketClient:
         event : dict
             event data
         """
-        _topics = {
-            Topics.START_TYPING.value: "on_start_typing",
-            Topics.END_RECORDING.value: "on_end_typing",
-            Topics.START_RECODING.value: "on_start_recording",
-            Topics.END_RECORDING.value: "on_end_recording",
-            Topics.ONLINE_MEMBERS.value: "on_online_members",
-        }
-        await (
-            self.client.events.get(
-                _topics.get(parse_topic(event["topic"])["topic"], "on_livelayer"),
-                empty_cb,
-            )(event)
+        callback = self._topic_dispatch.get(
+            parse_topic(event["topic"])["topic"], self._on_livelayer
         )
+        if callback is not empty_cb:
+            await callback(event)
 
     async def sock_conn(self):
-        """While the socket is open, this iterates over all the received messages.
+        """While the socket is open, this receives and decodes every frame until the socket closes.
         If it receives a text message, it will go to `self.handle_message` instead.
         """
-        async for message in self.socket:
-            event = message.json()
-            if event["t"] == SocketCodes.MESSAGE:
+        receive = self.socket.receive
+        loads = _loads
+        message_code = SocketCodes.MESSAGE.value
+        notification_code = SocketCodes.NOTIFICATION.value
+        livelayer_code = SocketCodes.LIVE_LAYER_USER_JOINED_EVENT.value
+        while True:
+            frame = await receive()
+            if frame.type in _CLOSING_TYPES:
+                break
+            if frame.type not in _DATA_TYPES:
+                continue
+            event = loads(frame.data)
+            code, data = event["t"], event.get("o")
+            if code == message_code:
+                chat_message = data["chatMessage"]
                 message = Message(
                     client=self.client,
-                    ndcId=event["o"]["ndcId"],
-                    **event["o"]["chatMessage"],
+                    ndcId=data["ndcId"],
+                    **chat_message,
                 )
                 await self.handle_message(message)
-                await self.send(
-                    SocketCodes.MESSAGE_ACK,
-                    {
-                        "ndcId": message.ndcId,
-                        "threadId": message.threadId,
-                        "messageId": message.id,
-                        "markHasRead": True,
-                        "createdTime": event["o"]["chatMessage"]["createdTime"],
-                    },
+                self._acks.put_nowait(
+                    (
+                        SocketCodes.MESSAGE_ACK,
+                        {
+                            "ndcId": message.ndcId,
+                            "threadId": message.threadId,
+                            "messageId": message.id,
+                            "markHasRead": True,
+                            "createdTime": chat_message["createdTime"],
+                        },
+                    )
                 )
-            elif event["t"] == SocketCodes.NOTIFICATION:
-                await self.handle_notification(Notification(event["o"]))
-            elif event["t"] == SocketCodes.LIVE_LAYER_USER_JOINED_EVENT:
-                await self.handle_livelayer(event["o"])
-            else:
+            elif code == notification_code:
+                await self.handle_notification(Notification(data))
+            elif code == livelayer_code:
+                await self.handle_livelayer(data)
+            elif self.client.logger.isEnabledFor(INFO):
                 self.client.logger.info(
-                    f"[{asctime()}] Socket sent unhandled message: {message}"
+                    "[%s] Socket sent unhandled message: %s", asctime(), event
                 )
 
     async def send(self, code: int, obj: dict):
-        self.client.logger.info(f"[{asctime()}] Sending Message to socket: {obj}")
-        await self.socket.send_json(
-            {"t": code, "o": {"id": str(round(time() % 86400)), **obj}}
+        if self.client.logger.isEnabledFor(INFO):
+            self.client.logger.info(
+                "[%s] Sending Message to socket: %s", asctime(), obj
+            )
+        await self.socket.send_str(
+            json_serialize(
+                {"t": code, "o": {**obj, "id": str(next(self._send_ids) % 86400)}}
+            )
         )
 
     async def subscribe(self, topic: str, *, ndcId: str = ""):
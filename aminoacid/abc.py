@@ -2,18 +2,79 @@ from __future__ import annotations
 
 from abc import ABC
 from base64 import b64encode, urlsafe_b64decode
-from importlib.util import find_spec
-from os import PathLike, path
-from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, List, Optional, Union
+from functools import cached_property, singledispatch
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
+from stat import S_ISREG
+from sys import intern
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .util import str_to_ts
 
-_ORJSON = find_spec("orjson")
-if _ORJSON:
+try:
     import orjson as json
-else:
+
+    _ORJSON = True
+except ImportError:
     import json
 
+    _ORJSON = False
+
+_loads = json.loads
+"""`orjson.loads` if orjson is installed, `json.loads` otherwise"""
+
+
+if _ORJSON:
+
+    def json_serialize(obj: Any, *args, **kwargs) -> str:
+        """Function to serialize data with ORJson if its installed, uses built in json module if not
+
+        Parameters
+        ----------
+        obj : dict
+            object to serialize
+
+        Returns
+        -------
+        str
+            serialized json data
+        """
+        return json.dumps(obj).decode()
+
+    json_bytes = json.dumps
+
+else:
+
+    def json_serialize(obj: Any, *args, **kwargs) -> str:
+        """Function to serialize data with ORJson if its installed, uses built in json module if not
+
+        Parameters
+        ----------
+        obj : dict
+            object to serialize
+
+        Returns
+        -------
+        str
+            serialized json data
+        """
+        return json.dumps(obj)
+
+    def json_bytes(obj: Any) -> bytes:
+        """Same as `json_serialize()` but returns the UTF-8 encoded bytes, orjson.dumps is used directly if it's installed"""
+        return json.dumps(obj).encode()
+
 
 if TYPE_CHECKING:
     from . import Bot
@@ -22,28 +83,45 @@ if TYPE_CHECKING:
 class AminoBaseClass(ABC):
     """This is the base class for all other classes defined by this library, except for clients and exceptions."""
 
+    __slots__ = ()
+
+    _repr_excluded: Optional[Tuple[type, ...]] = None
+    """Types that are left out of `__repr__()`, resolved on the first call because `aminoacid.Bot` imports this module"""
+
     def __init__(self) -> None:
         super().__init__()
 
+    def _attributes(self) -> Iterator[Tuple[str, Any]]:
+        """Yields the name and value of every attribute set on the object, both from `__dict__` and public `__slots__`"""
+        yield from getattr(self, "__dict__", {}).items()
+        for cls in type(self).__mro__:
+            for attr in getattr(cls, "__slots__", ()):
+                if attr.startswith("_"):
+                    continue
+                value = getattr(self, attr, None)
+                if value is not None:
+                    yield attr, value
+
     def __repr__(self) -> str:
         try:  #! pdoc complained that vars(self) is a function (which it is NOT) so there's this try/except here to catch that
-            _temp = [
-                f"{attr}={value!r}, "
-                for attr, value in vars(self).items()
-                if value
-                and not isinstance(
-                    value,
-                    (Callable, type(self.client))
-                    if "client" in dir(self)
-                    else Callable,
-                )
-            ]
-            return f"{type(self).__name__}({''.join(_temp).rstrip(', ')})"
+            excluded = AminoBaseClass._repr_excluded
+            if excluded is None:
+                from . import Bot
+
+                excluded = AminoBaseClass._repr_excluded = (Callable, Bot)
+            attributes = ", ".join(
+                f"{attr}={value!r}"
+                for attr, value in self._attributes()
+                if value and not isinstance(value, excluded)
+            )
+            return f"{type(self).__name__}({attributes})"
         except AttributeError:
             return f"{type(self).__name__}()"
 
 
 class MessageAble(AminoBaseClass):
+    __slots__ = ("_bot",)
+
     def __init__(self, bot: Bot) -> None:
         self._bot = bot
         super().__init__()
@@ -63,28 +141,7 @@ class MessageAble(AminoBaseClass):
         Message
             Message object of the sent message
         """
-        if isinstance(self, Message):
-            return await self.client.send_message(
-                content=content, threadId=self.threadId, ndcId=self.ndcId, **kwargs
-            )
-        if isinstance(self, Context):
-            return await self.client.send_message(
-                content=content,
-                threadId=self.message.threadId,
-                ndcId=self.message.ndcId,
-                **kwargs,
-            )
-        if isinstance(self, Thread):
-            return await self.client.send_message(
-                content=content, threadId=self.id, ndcId=self.ndcId, **kwargs
-            )
-        if isinstance(self, User):
-            return await self.client.message_user(
-                content=content,
-                userId=self.id,
-                ndcId=self.ndcId if "ndcId" in dir(self) else 0,
-                **kwargs,
-            )
+        return await _send_to(self, content, **kwargs)
 
 
 class Context(MessageAble):
@@ -162,6 +219,8 @@ class User(MessageAble):
 
     client: Bot
 
+    __slots__ = ("nickname", "content", "icon", "id", "client")
+
     def __init__(self, data: dict = {}, **kwargs) -> None:
         """Initialises a new `User` object, calls `from_dict()` with a combination of the kwargs and the supplied data
 
@@ -170,7 +229,7 @@ class User(MessageAble):
         data : dict, optional
             The data to initialise the `User` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        self.from_dict({**data, **kwargs} if kwargs else data)
         super().__init__(bot=self.client)
 
     def from_dict(self, data: dict):
@@ -181,11 +240,12 @@ class User(MessageAble):
         data : dict
             The dict to create the new `User` object from
         """
-        self.nickname = data.pop("nickname", "")
-        self.content = data.pop("content", "")
-        self.icon = data.pop("icon", "")
-        self.id = data.pop("uid", "")
-        self.client = data.pop("client")
+        # * Ids and nicknames repeat across every message of a user, so only one copy is kept
+        self.nickname = intern(data.get("nickname") or "")
+        self.content = data.get("content", "")
+        self.icon = data.get("icon", "")
+        self.id = intern(data.get("uid") or "")
+        self.client = data["client"]
 
     async def send(self, content: str, **kwargs) -> Message:
         return await super().send(content, **kwargs)
@@ -198,6 +258,8 @@ class User(MessageAble):
 class Member(User):
     ndcId: int
 
+    __slots__ = ("ndcId",)
+
     def __init__(self, data: dict = {}, **kwargs) -> None:
         """Initialises a new `Member` object, calls `from_dict()` with a combination of the kwargs and the supplied data
 
@@ -206,7 +268,7 @@ class Member(User):
         data : dict, optional
             The data to initialise the `Member` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        # * `User.__init__()` calls `self.from_dict()`, which also sets the ndcId
         super().__init__(data, **kwargs)
 
     def from_dict(self, data: dict):
@@ -217,7 +279,7 @@ class Member(User):
         data : dict
             The dict to create the new `Member` object from
         """
-        self.ndcId = data.pop("ndcId")
+        self.ndcId = data["ndcId"]
         return super().from_dict(data)
 
     async def fetch_blogs(self) -> List[Blog]:
@@ -237,7 +299,7 @@ class Message(AminoBaseClass):
     content: str
     author: Union[User, Member]
     threadId: str
-    ndcId: Optional[int] = None
+    ndcId: Optional[int]
     isHidden: bool
     includedInSummary: bool
     createdTime: int
@@ -251,6 +313,28 @@ class Message(AminoBaseClass):
 
     client: Bot
 
+    __slots__ = (
+        "client",
+        "nickname",
+        "content",
+        "id",
+        "threadId",
+        "ndcId",
+        "_thread",
+        "_author",
+        "_author_data",
+        "type",
+        "_createdTime",
+        "alertOption",
+        "chatBubbleId",
+        "clientRefId",
+        "extensions",
+        "isHidden",
+        "membershipStatus",
+        "includedInSummary",
+        "mediaType",
+    )
+
     def __init__(self, data: dict = {}, **kwargs) -> None:
         """Initialises a new `Message` object, calls `from_dict()` with a combination of the kwargs and the supplied data
 
@@ -259,9 +343,8 @@ class Message(AminoBaseClass):
         data : dict, optional
             The data to initialise the `Message` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        self.from_dict({**data, **kwargs} if kwargs else data)
         super().__init__()
-        self.startswith = self.content.startswith
 
     def from_dict(self, data: dict):
         """Create a new `Message` object from a dict
@@ -271,36 +354,94 @@ class Message(AminoBaseClass):
         data : dict
             The dict to create the new `Message` object from
         """
-        self.client = data.pop("client")
-
-        self.nickname = data.pop("nickname", "")
-        self.content = data.pop("content", "")
-        self.id = data.pop("messageId", "")
-        self.threadId = data.pop("threadId", "")
-        self.ndcId = data.pop("ndcId", 0)
-        self.thread = Thread(id=self.threadId, ndcId=self.ndcId, client=self.client)
-        if self.ndcId:
-            self.author = Member(
-                data.pop("author", {}), client=self.client, ndcId=self.ndcId
-            )
-        else:
-            self.author = User(data.pop("author", {}), client=self.client)
-        self.type = data.pop("type", None)
-
-        self.createdTime = str_to_ts(data.pop("createdTime", ""))
-        self.alertOption = data.pop("alertOption", None)
-        self.chatBubbleId = data.pop("chatBubbleId", "")
-        self.clientRefId = data.pop("clientRefId", 0)
-        self.extensions = data.pop("extensions", {})
-        self.isHidden = data.pop("isHidden", False)
-        self.membershipStatus = data.pop("membershipStatus", 0)
-        self.includedInSummary = data.pop("includedInSummary", True)
-        self.mediaType = data.pop("mediaType", 0)
+        self.client = data["client"]
+
+        self.nickname = data.get("nickname", "")
+        self.content = data.get("content", "")
+        self.id = data.get("messageId", "")
+        self.threadId = intern(data.get("threadId") or "")
+        self.ndcId = data.get("ndcId", 0)
+        self._author_data = data.get("author", {})
+        self.type = data.get("type", None)
+
+        self._createdTime = data.get("createdTime", "")
+        self.alertOption = data.get("alertOption", None)
+        self.chatBubbleId = data.get("chatBubbleId", "")
+        self.clientRefId = data.get("clientRefId", 0)
+        self.isHidden = data.get("isHidden", False)
+        self.membershipStatus = data.get("membershipStatus", 0)
+        self.includedInSummary = data.get("includedInSummary", True)
+        self.mediaType = data.get("mediaType", 0)
+        self.extensions = data.get("extensions", {})
+        self._thread = None
+        self._author = None
+
+    def _attributes(self) -> Iterator[Tuple[str, Any]]:
+        yield from super()._attributes()
+        yield "createdTime", self.createdTime
+        yield "author", self.author
+        yield "thread", self.thread
+
+    @property
+    def createdTime(self) -> int:
+        """UNIX timestamp of when the message was created, the Amino timestamp is only parsed when it's first accessed"""
+        created = self._createdTime
+        if isinstance(created, str):
+            created = self._createdTime = str_to_ts(created) if created else 0
+        return created
+
+    @property
+    def author(self) -> Union[User, Member]:
+        """The author of the message, this is only created when it's first accessed"""
+        if self._author is None:
+            if self.ndcId:
+                self._author = Member(
+                    self._author_data, client=self.client, ndcId=self.ndcId
+                )
+            else:
+                self._author = User(self._author_data, client=self.client)
+        return self._author
+
+    @property
+    def author_id(self) -> str:
+        """The uid of the message author, read without creating `author`"""
+        if self._author is not None:
+            return self._author.id
+        return self._author_data.get("uid") or ""
+
+    @property
+    def thread(self) -> Thread:
+        """The thread the message was sent in, this is only created when it's first accessed"""
+        if self._thread is None:
+            # * Messages from the same thread share one `Thread` for as long as any of them is alive
+            threads = self.client._threads
+            key = (self.ndcId, self.threadId)
+            if (thread := threads.get(key)) is None:
+                thread = threads[key] = Thread(
+                    id=self.threadId, ndcId=self.ndcId, client=self.client
+                )
+            self._thread = thread
+        return self._thread
+
+    def startswith(self, prefix: Union[str, Tuple[str, ...]], *args) -> bool:
+        """Shortcut to `str.startswith()` on the content of the message
+
+        Parameters
+        ----------
+        prefix : Union[str, Tuple[str, ...]]
+            The prefix or prefixes to check for
+
+        Returns
+        -------
+        bool
+            Whether the content starts with the prefix
+        """
+        return self.content.startswith(prefix, *args)
 
     async def get(self):
         """Get the complete `Message` object, used when a `Message` is received partially by the socket to get the missing information."""
         await self.client.fetch_message(
-            messageId=self.id, threadId=self.thread.id, ndcId=self.ndcId
+            messageId=self.id, threadId=self.threadId, ndcId=self.ndcId
         )
 
 
@@ -308,9 +449,13 @@ class Thread(MessageAble):
     id: str
     content: str
     author: User
-    ndcId: Optional[int] = None
+    ndcId: Optional[int]
     title: str
 
+    _fields = ("client", "title", "content", "author", "id", "ndcId")
+    """Data fields of the thread, these are copied by `get()`"""
+    __slots__ = _fields + ("__weakref__",)
+
     # TODO: FINISH THIS
 
     def __init__(self, data: dict = {}, **kwargs) -> None:
@@ -321,7 +466,7 @@ class Thread(MessageAble):
         data : dict, optional
             The data to initialise the `Thread` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        self.from_dict({**data, **kwargs} if kwargs else data)
         super().__init__(bot=self.client)
 
     def from_dict(self, data: dict):
@@ -332,22 +477,22 @@ class Thread(MessageAble):
         data : dict
             The dict to create the new `Thread` object from
         """
-        self.client = data.pop("client")
+        self.client = data["client"]
 
-        self.title = data.pop("title", "")
-        self.content = data.pop("content", "")
-        self.author = data.pop("author", "")
-        self.id = data.pop("threadId", "") or data.pop("id", "")
-        self.ndcId = data.pop("ndcId", "")
+        self.title = data.get("title", "")
+        self.content = data.get("content", "")
+        self.author = data.get("author", "")
+        self.id = data.get("threadId", "") or data.get("id", "")
+        self.ndcId = data.get("ndcId", "")
 
     async def send(self, content: str, **kwargs) -> Message:
         return await super().send(content, **kwargs)
 
     async def get(self):
         """Get the complete `Thread` object, used when a `Thread` is received partially by the socket to get the missing information."""
-        self.from_dict(
-            (await self._bot.get_thread(ndcId=self.ndcId, threadId=self.id)).__dict__
-        )
+        thread = await self.client.fetch_thread(self.id, ndcId=self.ndcId)
+        for attr in Thread._fields:
+            setattr(self, attr, getattr(thread, attr))
 
 
 class Community(AminoBaseClass):
@@ -385,7 +530,7 @@ class Community(AminoBaseClass):
         data : dict, optional
             The data to initialise the `Community` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        self.from_dict({**data, **kwargs} if kwargs else data)
         super().__init__()
 
     def from_dict(self, data: dict):
@@ -396,10 +541,10 @@ class Community(AminoBaseClass):
         data : dict
             The dict to create the new `Community` object from
         """
-        self.client = data.pop("client")
+        self.client = data["client"]
 
-        self.name = data.pop("name", "")
-        self.id = data.pop("ndcId", "")
+        self.name = data.get("name", "")
+        self.id = data.get("ndcId", "")
 
 
 class Blog(AminoBaseClass):
@@ -424,7 +569,7 @@ class Blog(AminoBaseClass):
         data : dict, optional
             The data to initialise the `Blog` with, by default {}
         """
-        self.from_dict({**data, **kwargs})
+        self.from_dict({**data, **kwargs} if kwargs else data)
         super().__init__()
 
     def from_dict(self, data: dict):
@@ -435,20 +580,20 @@ class Blog(AminoBaseClass):
         data : dict
             The dict to create the new `Blog` object from
         """
-        self.client = data.pop("client")
+        self.client = data["client"]
 
-        self.title = data.pop("title", "")
-        self.id = data.pop("blogId", "") or data.pop("id", "")
-        self.ndcId = data.pop("ndcId", "")
+        self.title = data.get("title", "")
+        self.id = data.get("blogId", "") or data.get("id", "")
+        self.ndcId = data.get("ndcId", "")
         self.author = Member(
-            data.pop("author", {}), client=self.client, ndcId=self.ndcId
+            data.get("author", {}), client=self.client, ndcId=self.ndcId
         )
-        self.content = data.pop("content", "")
-        self.createdTime = str_to_ts(data.pop("createdTime", ""))
-        self.modifiedTime = str_to_ts(data.pop("modifiedTime", ""))
-        self.mediaList = data.pop("mediaList", [])
-        self.status = data.pop("status", "")
-        self.type = data.pop("type")
+        self.content = data.get("content", "")
+        self.createdTime = str_to_ts(data.get("createdTime", ""))
+        self.modifiedTime = str_to_ts(data.get("modifiedTime", ""))
+        self.mediaList = data.get("mediaList", [])
+        self.status = data.get("status", "")
+        self.type = data["type"]
 
     async def tip(self, amount: int):
         """Send coins to a blog, shortcut to `aminoacid.client.ApiClient.tip_blog()`
@@ -462,6 +607,8 @@ class Blog(AminoBaseClass):
 
 
 class Embed(AminoBaseClass):
+    __slots__ = ("id", "type", "link", "title", "content", "mediaList")
+
     def __init__(
         self,
         objectId: str,
@@ -481,7 +628,14 @@ class Embed(AminoBaseClass):
 
         super().__init__()
 
-    def __dict__(self):
+    def to_dict(self) -> dict:
+        """Returns the embed in the format the API expects as `attachedObject`
+
+        Returns
+        -------
+        dict
+            the embed data
+        """
         return {
             "objectId": self.id,
             "objectType": self.type,
@@ -492,6 +646,10 @@ class Embed(AminoBaseClass):
         }
 
 
+_MMAP_THRESHOLD = 1 << 20
+"""Image files larger than this (in bytes) are memory mapped by `linkSnippet` instead of read"""
+
+
 class linkSnippet(AminoBaseClass):
     def __init__(self, link: str, image: Union[BinaryIO, PathLike]) -> None:
         """Initialises a new Link Snippet object to use for sending them in chat
@@ -504,8 +662,13 @@ class linkSnippet(AminoBaseClass):
             Either a Path of the image or an IO representation of the image
         """
         if isinstance(image, PathLike):
-            if path.exists(image):
-                with open(image, "rb") as f:
+            with open(image, "rb") as f:
+                info = fstat(f.fileno())
+                if S_ISREG(info.st_mode) and info.st_size > _MMAP_THRESHOLD:
+                    # * Encode large files straight from the page cache instead of reading a copy first
+                    with mmap(f.fileno(), 0, access=ACCESS_READ) as m:
+                        self.image = b64encode(m)
+                else:
                     self.image = b64encode(f.read())
         else:
             self.image = b64encode(image.read())
@@ -568,7 +731,6 @@ class Notification(AminoBaseClass):
 
         self.payload = data.pop("payload", {})
 
-        self.timestamp = self.payload.get("ts", "")
         self.threadId = self.payload.get("tid", "")
         self.isHiddem = self.payload.get("isHidden", "")
         self.id = self.payload.get("id", "")
@@ -578,8 +740,11 @@ class Notification(AminoBaseClass):
 
         self.data = data
 
-        if self.timestamp:
-            self.timestamp = str_to_ts(self.timestamp)
+    @cached_property
+    def timestamp(self) -> int:
+        """UNIX timestamp of the notification, the Amino timestamp is only parsed when it's first accessed"""
+        timestamp = self.payload.get("ts", "")
+        return str_to_ts(timestamp) if timestamp else 0
 
 
 class Session(AminoBaseClass):
@@ -608,6 +773,50 @@ class Session(AminoBaseClass):
         dict
             dictionary containing all of the information
         """
-        return json.loads(
-            urlsafe_b64decode(session + "=" * (4 - len(session) % 4))[1:-20]
-        )
+        decoded = urlsafe_b64decode(session + "=" * (-len(session) & 3))
+        # * orjson reads straight from a memoryview, json needs the slice copied into bytes
+        return _loads(memoryview(decoded)[1:-20] if _ORJSON else decoded[1:-20])
+
+
+@singledispatch
+async def _send_to(self: MessageAble, content: str, **kwargs) -> Optional[Message]:
+    """Sends a message to the given object, the implementation is picked by the type of `self`, see `MessageAble.send()`"""
+    return None
+
+
+@_send_to.register(Message)
+async def _send_to_message(self: Message, content: str, **kwargs) -> Message:
+    return await self.client.send_message(
+        content=content, threadId=self.threadId, ndcId=self.ndcId, **kwargs
+    )
+
+
+@_send_to.register(Context)
+async def _send_to_context(self: Context, content: str, **kwargs) -> Message:
+    return await self.client.send_message(
+        content=content,
+        threadId=self.message.threadId,
+        ndcId=self.message.ndcId,
+        **kwargs,
+    )
+
+
+@_send_to.register(Thread)
+async def _send_to_thread(self: Thread, content: str, **kwargs) -> Message:
+    return await self.client.send_message(
+        content=content, threadId=self.id, ndcId=self.ndcId, **kwargs
+    )
+
+
+@_send_to.register(User)
+async def _send_to_user(self: User, content: str, **kwargs) -> Message:
+    return await self.client.message_user(
+        content=content, userId=self.id, ndcId=0, **kwargs
+    )
+
+
+@_send_to.register(Member)
+async def _send_to_member(self: Member, content: str, **kwargs) -> Message:
+    return await self.client.message_user(
+        content=content, userId=self.id, ndcId=self.ndcId, **kwargs
+    )
@@ -1,5 +1,5 @@
+from asyncio import gather
 from os import PathLike
-from time import time
 from typing import BinaryIO, List, Optional, Union
 from uuid import uuid4
 
@@ -14,12 +14,42 @@ from .abc import (
     User,
     Community,
     Blog,
+    _loads,
 )
+from .util import now_ms
+
+
+def _path(ndcId: Optional[Union[int, str]], suffix: str) -> str:
+    """Prefixes an API path with the community scope, or the global one if no ndcId is given"""
+    return f"/x{ndcId}/s/{suffix}" if ndcId else f"/g/s/{suffix}"
 
 
 class ApiClient(AminoBaseClass):
     """ApiClient skeleton to reduce repeating API calls in code and to clean up code"""
 
+    async def _api(self, method: str, url: str, **kwargs) -> dict:
+        """Sends a request and decodes the response, raising the matching exception if the API reports an error
+
+        Parameters
+        ----------
+        method : str
+            Method of the request
+        url : str
+            url to be appended to the base
+
+        Returns
+        -------
+        dict
+            The decoded response
+        """
+        # * Both loaders take the raw body, so it is never decoded into a str first
+        response = _loads(
+            await (await self._http.request(method, url, **kwargs)).read()
+        )
+        if (code := response.get("api:statuscode")) != 0:
+            exceptions.handle_exception(code, response)
+        return response
+
     async def login(self, email: str, password: str) -> User:
         """Authenticates with the given email and password
 
@@ -35,24 +65,19 @@ class ApiClient(AminoBaseClass):
         User
             The user that was authenticated
         """
-        response = await (
-            await self._http.request(
-                "POST",
-                "/g/s/auth/login",
-                json={
-                    "email": email,
-                    "v": 2,
-                    "secret": f"0 {password}",
-                    "deviceID": self._http.device,
-                    "clientType": 100,
-                    "action": "normal",
-                    "timestamp": int(time() * 1000),
-                },
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api(
+            "POST",
+            "/g/s/auth/login",
+            json={
+                "email": email,
+                "v": 2,
+                "secret": f"0 {password}",
+                "deviceID": self._http.device,
+                "clientType": 100,
+                "action": "normal",
+                "timestamp": now_ms(),
+            },
+        )
 
         self.profile = User(**(response["userProfile"]), client=self)
         self._http.session = Session(response.get("sid"))
@@ -74,17 +99,7 @@ class ApiClient(AminoBaseClass):
         Thread
             The `Thread` object that was requested
         """
-        response = await (
-            await self._http.request(
-                "GET",
-                f"/x{ndcId}/s/chat/thread/{threadId}"
-                if ndcId
-                else f"/g/s/chat/thread/{threadId}",
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api("GET", _path(ndcId, f"chat/thread/{threadId}"))
         return Thread(**(response["thread"]), client=self)
 
     async def fetch_message(
@@ -106,17 +121,9 @@ class ApiClient(AminoBaseClass):
         Message
             The `Message` object that was requested
         """
-        response = await (
-            await self._http.request(
-                "GET",
-                f"/x{ndcId}/s/chat/thread/{threadId}/message/{messageId}"
-                if ndcId
-                else f"/g/s/chat/thread/{threadId}/message/{messageId}",
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api(
+            "GET", _path(ndcId, f"chat/thread/{threadId}/message/{messageId}")
+        )
         return Thread(**(response["message"]), client=self)
 
     async def fetch_user(self, userId: str) -> User:
@@ -132,12 +139,7 @@ class ApiClient(AminoBaseClass):
         User
             The `User` object that was requested
         """
-        response = await (
-            await self._http.request("GET", f"/g/s/user-profile/{userId}")
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api("GET", f"/g/s/user-profile/{userId}")
         return User(**(response["userProfile"]), client=self)
 
     async def fetch_member(self, userId: str, ndcId: str) -> Member:
@@ -155,15 +157,27 @@ class ApiClient(AminoBaseClass):
         Member
             The `Member` object requested for the given community
         """
-        response = await (
-            await self._http.request("GET", f"/x{ndcId}/s/user-profile/{userId}")
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api("GET", f"/x{ndcId}/s/user-profile/{userId}")
 
         return Member(**(response["userProfile"]), client=self)
 
+    async def fetch_members(self, userIds: List[str], ndcId: str) -> List[Member]:
+        """Fetches several members of a community at once, the requests are sent concurrently
+
+        Parameters
+        ----------
+        userIds : List[str]
+            The userIds to fetch
+        ndcId : str
+            The community the users are members in
+
+        Returns
+        -------
+        List[Member]
+            The `Member` objects in the same order as `userIds`
+        """
+        return await gather(*(self.fetch_member(userId, ndcId) for userId in userIds))
+
     async def send_message(
         self,
         threadId: str,
@@ -191,25 +205,19 @@ class ApiClient(AminoBaseClass):
         Message
             Returns the `Message` object of the sent message
         """
-        response = await (
-            await self._http.request(
-                "POST",
-                f"/x{ndcId}/s/chat/thread/{threadId}/message"
-                if ndcId
-                else f"/g/s/chat/thread/{threadId}",
-                json={
-                    "type": 0,
-                    "content": content,
-                    "clientRefId": int(time() % 86400),
-                    "timestamp": int(time() * 1000),
-                    "attachedObject": embed.__dict__(),
-                    **kwargs,
-                },
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        timestamp = now_ms()
+        response = await self._api(
+            "POST",
+            _path(ndcId, f"chat/thread/{threadId}/message"),
+            json={
+                "type": 0,
+                "content": content,
+                "clientRefId": timestamp // 1000 % 86400,
+                "timestamp": timestamp,
+                "attachedObject": embed.to_dict(),
+                **kwargs,
+            },
+        )
         return Message(**(response["message"]), client=self)
 
     async def start_dm(self, userId: str, *, ndcId: Optional[str] = "") -> Thread:
@@ -227,23 +235,18 @@ class ApiClient(AminoBaseClass):
         Thread
             Thread of the DMs
         """
-        response = await (
-            await self._http.request(
-                "POST",
-                f"/x{ndcId}/s/chat/thread/" if ndcId else f"/g/s/chat/thread/",
-                json={
-                    "title": None,
-                    "content": None,
-                    "initialMessageContent": None,
-                    "timestamp": int(time() * 1000),
-                    "inviteeUids": [userId],
-                    "type": 0,
-                },
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api(
+            "POST",
+            _path(ndcId, "chat/thread/"),
+            json={
+                "title": None,
+                "content": None,
+                "initialMessageContent": None,
+                "timestamp": now_ms(),
+                "inviteeUids": [userId],
+                "type": 0,
+            },
+        )
 
         return Thread(**(response["thread"]), client=self)
 
@@ -281,12 +284,7 @@ class ApiClient(AminoBaseClass):
             kwargs = {"file": image}
         else:
             kwargs = {"data": image}
-        response = await (
-            await self._http.request("POST", "/g/s/media/upload", **kwargs)
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api("POST", "/g/s/media/upload", **kwargs)
 
         return response["mediaValue"]
 
@@ -303,25 +301,21 @@ class ApiClient(AminoBaseClass):
         Optional[dict]
             A dictionary containing devOptions, returns None if it doesn't exist
         """
-        response = await (
-            await self._http.request(
-                "POST",
-                f"/x{ndcId}/s/device" if ndcId else "/g/s/device",
-                json={
-                    "deviceID": self._http.device,
-                    "bundleID": "com.narvii.amino.master",
-                    "clientType": 100,
-                    "timezone": 60,
-                    "systemPushEnabled": True,
-                    "locale": "en_DE",
-                    "deviceToken": self._http.token,
-                    "deviceTokenType": 1,
-                    "timestamp": int(time() * 1000),
-                },
-            )
-        ).json()
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api(
+            "POST",
+            _path(ndcId, "device"),
+            json={
+                "deviceID": self._http.device,
+                "bundleID": "com.narvii.amino.master",
+                "clientType": 100,
+                "timezone": 60,
+                "systemPushEnabled": True,
+                "locale": "en_DE",
+                "deviceToken": self._http.token,
+                "deviceTokenType": 1,
+                "timestamp": now_ms(),
+            },
+        )
 
         return response["devOptions"]
 
@@ -342,19 +336,39 @@ class ApiClient(AminoBaseClass):
         List[Community]
             List of `Community` objects describing the communities
         """
-        response = await (
-            await self._http.request(
-                "GET", "/g/s/community/joined", params={"start": start, "size": size}
-            )
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api(
+            "GET", "/g/s/community/joined", params={"start": start, "size": size}
+        )
         return [
             Community(**community, client=self)
             for community in response["communityList"]
         ]
 
+    async def fetch_all_communities(
+        self, total: int, size: int = 25
+    ) -> List[Community]:
+        """Fetch `total` communities that the bot is in, the pages are requested concurrently
+
+        Parameters
+        ----------
+        total : int
+            amount of communities to fetch
+        size : int, optional
+            amount of communities per request, by default 25
+
+        Returns
+        -------
+        List[Community]
+            List of `Community` objects describing the communities
+        """
+        pages = await gather(
+            *(
+                self.fetch_communities(start=start, size=min(size, total - start))
+                for start in range(0, total, size)
+            )
+        )
+        return [community for page in pages for community in page]
+
     async def fetch_blogs(
         self, ndcId: str, start: int = 0, size: int = 25, *, userId: Optional[str] = ""
     ) -> List[Blog]:
@@ -377,12 +391,7 @@ class ApiClient(AminoBaseClass):
             "url": f"/x{ndcId}/s/blog" if userId else f"/x{ndcId}/s/feed/blog-all",
             **({"type": "user", "q": userId} if userId else {}),
         }
-        response = await (
-            await self._http.request("GET", params.pop("url"), params=params)
-        ).json()
-
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        response = await self._api("GET", params.pop("url"), params=params)
         return [Blog(**blog, client=self) for blog in response["blogList"]]
 
     async def tip_blog(self, ndcId: str, blogId: str, amount: int):
@@ -397,16 +406,12 @@ class ApiClient(AminoBaseClass):
         amount : int
             the amount of coins to send
         """
-        response = await (
-            await self._http.request(
-                "POST",
-                f"/x{ndcId}/s/blog/{blogId}/tipping",
-                json={
-                    "coins": amount,
-                    "tippingContext": {"transactionId": str(uuid4())},
-                    "timestamp": int(time() * 1000),
-                },
-            )
-        ).json()
-        if response.get("api:statuscode") != 0:
-            return exceptions.handle_exception(response.get("api:statuscode"), response)
+        await self._api(
+            "POST",
+            f"/x{ndcId}/s/blog/{blogId}/tipping",
+            json={
+                "coins": amount,
+                "tippingContext": {"transactionId": str(uuid4())},
+                "timestamp": now_ms(),
+            },
+        )
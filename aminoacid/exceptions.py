@@ -321,6 +321,94 @@ class InvalidName(AminoBaseException):
     ...
 
 
+# TODO: Complete this list
+_EXCEPTIONS = {
+    100: UnsupportedService,
+    102: FileTooLarge,
+    103: InvalidRequest,
+    104: InvalidRequest,
+    105: InvalidSession,
+    106: AccessDenied,
+    107: UnexistentData,
+    110: ActionNotAllowed,
+    113: MessageNeeded,
+    200: InvalidAccountOrPassword,
+    201: AccountDisabled,
+    210: AccountDisabled,
+    213: InvalidEmail,
+    214: InvalidPassword,
+    215: EmailAlreadyTaken,
+    216: AccountDoesntExist,
+    218: InvalidDevice,
+    219: TooManyRequests,
+    221: CantFollowYourself,
+    225: UserUnavailable,
+    229: YouAreBanned,
+    230: UserNotMemberOfCommunity,
+    235: RequestRejected,
+    238: ActivateAccount,
+    239: CantLeaveCommunity,
+    240: ReachedTitleLength,
+    241: EmailFlaggedAsSpam,
+    246: AccountDeleted,
+    251: API_ERR_EMAIL_NO_PASSWORD,
+    257: API_ERR_COMMUNITY_USER_CREATED_COMMUNITIES_VERIFY,
+    262: ReachedMaxTitles,
+    270: VerificationRequired,
+    271: API_ERR_INVALID_AUTH_NEW_DEVICE_LINK,
+    291: CommandCooldown,
+    293: UserBannedByTeamAmino,
+    300: BadImage,
+    313: InvalidThemepack,
+    314: InvalidVoiceNote,
+    500: RequestedNoLongerExist,
+    700: RequestedNoLongerExist,
+    1600: RequestedNoLongerExist,
+    503: PageRepostedTooRecently,
+    551: InsufficientLevel,
+    702: WallCommentingDisabled,
+    801: CommunityNoLongerExists,
+    802: InvalidCodeOrLink,
+    805: CommunityNameAlreadyTaken,
+    806: CommunityCreateLimitReached,
+    814: CommunityDisabled,
+    833: CommunityDeleted,
+    1002: ReachedMaxCategories,
+    1501: DuplicatePollOption,
+    1507: ReachedMaxPollOptions,
+    1602: TooManyChats,
+    1605: ChatFull,
+    1606: TooManyInviteUsers,
+    1611: ChatInvitesDisabled,
+    1612: RemovedFromChat,
+    1613: UserNotJoined,
+    1627: API_ERR_CHAT_VVCHAT_NO_MORE_REPUTATIONS,
+    1637: MemberKickedByOrganizer,
+    1661: LevelFiveRequiredToEnableProps,
+    1663: ChatViewOnly,
+    1664: ChatMessageTooBig,
+    1900: InviteCodeNotFound,
+    2001: AlreadyRequestedJoinCommunity,
+    2501: API_ERR_PUSH_SERVER_LIMITATION_APART,
+    2502: API_ERR_PUSH_SERVER_LIMITATION_COUNT,
+    2503: API_ERR_PUSH_SERVER_LINK_NOT_IN_COMMUNITY,
+    2504: API_ERR_PUSH_SERVER_LIMITATION_TIME,
+    2601: AlreadyCheckedIn,
+    2611: AlreadyUsedMonthlyRepair,
+    2800: AccountAlreadyRestored,
+    3102: IncorrectVerificationCode,
+    3905: NotOwnerOfChatBubble,
+    4300: NotEnoughCoins,
+    4400: AlreadyPlayedLottery,
+    4500: CannotSendCoins,
+    4501: CannotSendCoins,
+    6001: AminoIDAlreadyChanged,
+    6002: InvalidAminoID,
+    9901: InvalidName,
+}
+"""Maps an api:statuscode to the exception raised for it"""
+
+
 def handle_exception(code: int, data=""):
     """Raises a given exception
 
@@ -329,93 +417,7 @@ def handle_exception(code: int, data=""):
     code : int
         The api:statuscode
     """
-    # TODO: Complete this list
-    raise (
-        {
-            100: UnsupportedService,
-            102: FileTooLarge,
-            103: InvalidRequest,
-            104: InvalidRequest,
-            105: InvalidSession,
-            106: AccessDenied,
-            107: UnexistentData,
-            110: ActionNotAllowed,
-            113: MessageNeeded,
-            200: InvalidAccountOrPassword,
-            201: AccountDisabled,
-            210: AccountDisabled,
-            213: InvalidEmail,
-            214: InvalidPassword,
-            215: EmailAlreadyTaken,
-            216: AccountDoesntExist,
-            218: InvalidDevice,
-            219: TooManyRequests,
-            221: CantFollowYourself,
-            225: UserUnavailable,
-            229: YouAreBanned,
-            230: UserNotMemberOfCommunity,
-            235: RequestRejected,
-            238: ActivateAccount,
-            239: CantLeaveCommunity,
-            240: ReachedTitleLength,
-            241: EmailFlaggedAsSpam,
-            246: AccountDeleted,
-            251: API_ERR_EMAIL_NO_PASSWORD,
-            257: API_ERR_COMMUNITY_USER_CREATED_COMMUNITIES_VERIFY,
-            262: ReachedMaxTitles,
-            270: VerificationRequired,
-            271: API_ERR_INVALID_AUTH_NEW_DEVICE_LINK,
-            291: CommandCooldown,
-            293: UserBannedByTeamAmino,
-            300: BadImage,
-            313: InvalidThemepack,
-            314: InvalidVoiceNote,
-            500: RequestedNoLongerExist,
-            700: RequestedNoLongerExist,
-            1600: RequestedNoLongerExist,
-            503: PageRepostedTooRecently,
-            551: InsufficientLevel,
-            702: WallCommentingDisabled,
-            801: CommunityNoLongerExists,
-            802: InvalidCodeOrLink,
-            805: CommunityNameAlreadyTaken,
-            806: CommunityCreateLimitReached,
-            814: CommunityDisabled,
-            833: CommunityDeleted,
-            1002: ReachedMaxCategories,
-            1501: DuplicatePollOption,
-            1507: ReachedMaxPollOptions,
-            1602: TooManyChats,
-            1605: ChatFull,
-            1606: TooManyInviteUsers,
-            1611: ChatInvitesDisabled,
-            1612: RemovedFromChat,
-            1613: UserNotJoined,
-            1627: API_ERR_CHAT_VVCHAT_NO_MORE_REPUTATIONS,
-            1637: MemberKickedByOrganizer,
-            1661: LevelFiveRequiredToEnableProps,
-            1663: ChatViewOnly,
-            1664: ChatMessageTooBig,
-            1900: InviteCodeNotFound,
-            2001: AlreadyRequestedJoinCommunity,
-            2501: API_ERR_PUSH_SERVER_LIMITATION_APART,
-            2502: API_ERR_PUSH_SERVER_LIMITATION_COUNT,
-            2503: API_ERR_PUSH_SERVER_LINK_NOT_IN_COMMUNITY,
-            2504: API_ERR_PUSH_SERVER_LIMITATION_TIME,
-            2601: AlreadyCheckedIn,
-            2611: AlreadyUsedMonthlyRepair,
-            2800: AccountAlreadyRestored,
-            3102: IncorrectVerificationCode,
-            3905: NotOwnerOfChatBubble,
-            4300: NotEnoughCoins,
-            4400: AlreadyPlayedLottery,
-            4500: CannotSendCoins,
-            4501: CannotSendCoins,
-            6001: AminoIDAlreadyChanged,
-            6002: InvalidAminoID,
-            9901: InvalidName,
-        }.get(code, UnknownExcepion)
-    )(data)
+    raise _EXCEPTIONS.get(code, UnknownExcepion)(data)
 
 
 class CommandNotFound(AminoBaseException):
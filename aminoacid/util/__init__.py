@@ -1,29 +1,58 @@
 from base64 import b64encode
-from datetime import datetime
-from hashlib import sha1
+from calendar import timegm
+from functools import lru_cache
 from hmac import HMAC
+from importlib.util import find_spec
+from time import time_ns
+from types import MappingProxyType
+from typing import Mapping
 
 from .commands import *
 
 __version__ = "0.1.5"
 
-str_to_ts = lambda _str: int(datetime.strptime(_str, "%Y-%m-%dT%H:%M:%SZ").timestamp())
-"""Convert an Amino Timestamp to a UNIX timestamp
 
-Parameters
-----------
-_str : str
-    The string to convert
+def str_to_ts(_str: str) -> int:
+    """Convert an Amino Timestamp (e.g. "2022-08-17T12:00:00Z") to a UNIX timestamp
+
+    Parameters
+    ----------
+    _str : str
+        The string to convert
+
+    Returns
+    ----------
+    int
+        The UNIX timestamp of the given Amino Timestamp
+    """
+    # * The format is fixed and always UTC, so the fields are sliced out instead of going through strptime
+    return timegm(
+        (
+            int(_str[0:4]),
+            int(_str[5:7]),
+            int(_str[8:10]),
+            int(_str[11:13]),
+            int(_str[14:16]),
+            int(_str[17:19]),
+        )
+    )
 
-Returns
-----------
-int
-    The UNIX timestamp of the given Amino Timestamp
-"""
 
+def now_ms() -> int:
+    """Current UNIX time in milliseconds, read with a single clock call and without float math
 
-def parse_topic(topic_str: str) -> dict:
+    Returns
+    -------
+    int
+        The UNIX timestamp in milliseconds
+    """
+    return time_ns() // 1_000_000
+
+
+@lru_cache(maxsize=1024)
+def parse_topic(topic_str: str) -> Mapping[str, str]:
     """Parses a topic string (e.g. "ndtopic:x1:users-start-typing-at:00000000-0000-0000-0000-000000000000")
+    Results are cached because the same topics keep recurring, so they are returned as read-only mappings
 
     Parameters
     ----------
@@ -32,13 +61,58 @@ def parse_topic(topic_str: str) -> dict:
 
     Returns
     -------
-    dict
-        Dictionary containing the scope, topic and extras given in the string
+    Mapping[str, str]
+        Read-only mapping containing the scope, topic and extras given in the string
     """
-    return {
-        key: field
-        for field, key in zip(topic_str.split(":")[1:], ["scope", "topic", "extras"])
-    }
+    return MappingProxyType(
+        {
+            key: field
+            for field, key in zip(
+                topic_str.split(":")[1:], ["scope", "topic", "extras"]
+            )
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def _keyed_hmac(key: bytes) -> HMAC:
+    """HMAC-SHA1 state with the key pads already hashed, `get_signature()` signs with a copy of it"""
+    return HMAC(key, digestmod="sha1")
+
+
+def get_signature(data: bytes, key: bytes, v: bytes) -> str:
+    """Generate the request signature for a given payload
+
+    Parameters
+    ----------
+    data : bytes
+        The payload to sign
+    key : bytes
+        the key to be used in the signature, this key has to be supplied by the user
+    v : bytes
+        version of the request signature, this is used as the prefix for the signature
+
+    Returns
+    -------
+    str
+        The base64 encoded signature
+    """
+    signer = _keyed_hmac(key).copy()
+    signer.update(data)
+    return b64encode(v + signer.digest()).decode("utf-8")
+
+
+# * aiohttp only decompresses brotli responses if one of these is installed
+_BROTLI = find_spec("brotli") or find_spec("brotlicffi")
+
+_BASE_HEADERS = {
+    "Accept-Language": "en-US",
+    "User-Agent": f"AminoAcid/{__version__} (+https://github.com/okok7711/AminoAcid)",
+    "Host": "service.narvii.com",
+    "Accept-Encoding": "br, gzip" if _BROTLI else "gzip",
+    "Connection": "Keep-Alive",
+}
+"""Headers that are the same for every request, `get_headers()` copies them and adds the per-request ones"""
 
 
 def get_headers(
@@ -62,17 +136,9 @@ def get_headers(
     dict
         Returns the Headers
     """
-    head = {
-        "NDCDEVICEID": device,
-        "Accept-Language": "en-US",
-        "User-Agent": f"AminoAcid/{__version__} (+https://github.com/okok7711/AminoAcid)",
-        "Host": "service.narvii.com",
-        "Accept-Encoding": "gzip",
-        "Connection": "Keep-Alive",
-    }
+    head = _BASE_HEADERS.copy()
+    head["NDCDEVICEID"] = device
     if data:
-        head["NDC-MSG-SIG"] = b64encode(v + HMAC(key, data, sha1).digest()).decode(
-            "utf-8"
-        )
+        head["NDC-MSG-SIG"] = get_signature(data, key, v)
 
     return head
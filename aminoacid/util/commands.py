@@ -1,7 +1,9 @@
 from __future__ import annotations
+from collections import OrderedDict
 from functools import wraps
 
 from inspect import signature
+from sys import intern
 from time import time
 from typing import (
     TYPE_CHECKING,
@@ -11,6 +13,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -23,16 +26,55 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+_NONE_TYPE = type(None)
+
+
+def _combine_checks(
+    check: Optional[Callable[[Context], bool]],
+    check_any: Tuple[Callable[[Context], bool], ...],
+) -> Optional[Callable[[Context], bool]]:
+    """Combines the checks of a command into a single predicate, returns None if there is nothing to check
+
+    Parameters
+    ----------
+    check : Optional[Callable[[Context], bool]]
+        Check that always has to pass
+    check_any : Tuple[Callable[[Context], bool], ...]
+        Checks of which any has to pass
+
+    Returns
+    -------
+    Optional[Callable[[Context], bool]]
+        The combined predicate
+    """
+    if not check_any:
+        return check
+    if check is None:
+        return lambda ctx: any(c(ctx) for c in check_any)
+    return lambda ctx: any(c(ctx) for c in check_any) and check(ctx)
+
 
 class UserCommand:
     """Command defined by User"""
 
+    __slots__ = (
+        "callback",
+        "_check",
+        "_check_any",
+        "_predicate",
+        "cooldown",
+        "name",
+        "handler",
+        "calls",
+        "_signature",
+    )
+
     def __init__(
         self,
         func: Callable[..., Coroutine[Any, Any, T]],
         command_name: str = "",
-        check: Optional[Callable[[Context], bool]] = lambda ctx: True,
-        check_any: Optional[List[Callable[[Context], bool]]] = list(),
+        check: Optional[Callable[[Context], bool]] = None,
+        check_any: Optional[List[Callable[[Context], bool]]] = None,
         cooldown: Optional[int] = 0,
     ) -> None:
         """Initialises a new UserCommand with a given function to call and a given name
@@ -44,18 +86,19 @@ class UserCommand:
         command_name : str, optional
             Name of the command, by default the function name
         check : Optional[Callable[[Context], bool]], optional
-            Function which is called to see if the command may be called, by default always returns True
+            Function which is called to see if the command may be called, by default None (no check)
         check_any : Optional[List[Callable[[Context], bool]]], optional
-            List of checks, command will execute if any of them return True, by default []
+            List of checks, command will execute if any of them return True, by default None (no checks)
         cooldown : Optional[int]
             Time to sleep before another instance of this command can be executed by the same user
         """
 
         self.callback = func
-        self.check = check
-        self.check_any = check_any
+        self._check = check
+        self._check_any = tuple(check_any) if check_any else ()
+        self._predicate = _combine_checks(check, self._check_any)
         self.cooldown = cooldown
-        self.name = command_name or func.__name__
+        self.name = intern(command_name or func.__name__)
 
         self.handler: Callable[
             [AminoBaseException, Context], Coroutine[Any, Any, T]
@@ -69,7 +112,28 @@ class UserCommand:
         ctx : Context
             The context of the command
         """
-        self.calls = {}
+        self.calls: OrderedDict[str, int] = OrderedDict()
+        self._signature: Optional[str] = None
+
+    @property
+    def check(self) -> Optional[Callable[[Context], bool]]:
+        """Function which is called to see if the command may be called"""
+        return self._check
+
+    @check.setter
+    def check(self, check: Optional[Callable[[Context], bool]]) -> None:
+        self._check = check
+        self._predicate = _combine_checks(check, self._check_any)
+
+    @property
+    def check_any(self) -> Tuple[Callable[[Context], bool], ...]:
+        """Checks of which any need to return True for the command to execute, assign a new list to change them"""
+        return self._check_any
+
+    @check_any.setter
+    def check_any(self, check_any: Optional[List[Callable[[Context], bool]]]) -> None:
+        self._check_any = tuple(check_any) if check_any else ()
+        self._predicate = _combine_checks(self._check, self._check_any)
 
     def error(self):
         """Register a function to be the error handler of this command, calls `self.register_handler()`"""
@@ -96,24 +160,28 @@ class UserCommand:
         self.handler = func
 
     def get_signature(self) -> str:
-        """Returns the signature of the Command
+        """Returns the signature of the Command, it is built on the first call and reused afterwards
 
         Returns
         -------
         str
             Signature of the command
         """
+        if self._signature is None:
+            self._signature = self._build_signature()
+        return self._signature
 
+    def _build_signature(self) -> str:
+        """Builds the signature string from the parameters of the callback"""
         params = signature(self.callback).parameters
         result = list()
         for name, param in params.items():
-            optional = bool(param.default)
+            optional = param.default is not param.empty
             annotation: Any = param.annotation
             origin = getattr(annotation, "__origin__", None)
             if origin is Union:
-                none_cls = type(None)
                 union_args = annotation.__args__
-                optional = union_args[-1] is none_cls
+                optional = union_args[-1] is _NONE_TYPE
                 if len(union_args) == 2 and optional:
                     annotation = union_args[0]
                     origin = getattr(annotation, "__origin__", None)
@@ -147,16 +215,16 @@ class UserCommand:
             returns the Callback return value
         """
 
-        if not any(
-            check(context) for check in self.check_any or [lambda _: True]
-        ) or not self.check(context):
+        if (predicate := self._predicate) is not None and not predicate(context):
             return context.client.logger.exception(CheckFailed(context))
-        if (current_time := int(time())) <= self.calls.get(
-            context.author.id, 0
-        ) + self.cooldown:
+        calls, author = self.calls, context.author.id
+        if (current_time := int(time())) <= calls.get(author, 0) + self.cooldown:
             return
-        self.calls[context.author.id] = current_time
-        context.client.logger.warning((self.calls, self.cooldown))
+        calls[author] = current_time
+        calls.move_to_end(author)
+        # * `calls` is ordered by last call, so expired cooldowns are at the front
+        while calls[oldest := next(iter(calls))] + self.cooldown < current_time:
+            del calls[oldest]
         return self.callback(context, *args, **kwargs)
 
     def __str__(self) -> str:
@@ -167,19 +235,19 @@ class UserCommand:
 
 
 class HelpCommand(UserCommand):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(self.help, "help")
 
     async def help(self, ctx: Context, command: str = ""):
         if not command:
-            await ctx.send(
-                f"\n".join(
-                    [
-                        ctx.client.prefix + name
-                        for name, _ in ctx.client.__command_map__.items()
-                    ]
+            if ctx.client._help_listing is None:
+                prefix = ctx.client.prefix
+                ctx.client._help_listing = "\n".join(
+                    prefix + name for name in ctx.client.__command_map__
                 )
-            )
-        if command not in ctx.client.__command_map__:
+            return await ctx.send(ctx.client._help_listing)
+        if (cmd := ctx.client.__command_map__.get(command)) is None:
             return ctx.client.logger.exception(CommandNotFound(ctx))
-        await ctx.send(ctx.client.__command_map__[command].get_signature())
+        await ctx.send(cmd.get_signature())
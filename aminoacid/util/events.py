@@ -2,7 +2,7 @@
 """
 from __future__ import annotations
 
-from logging import getLogger
+from logging import INFO, getLogger
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,6 +13,7 @@ logger = getLogger(__name__)
 
 async def on_message(message: Message):
     """This Event will trigger when a new text message is received, it will only be called if the message is not a command
+    and wasn't sent by the bot itself
 
     Parameters
     ----------
@@ -166,5 +167,6 @@ async def on_online_members(event: dict):
 
 
 async def empty_cb(*args, **kwargs):
-    """Empty callback for events, this is called when no event callback is defined by the user"""
-    logger.info(f"{args, kwargs}")
+    """Empty callback for events and command error handlers that aren't defined by the user, the socket skips events that resolve to it instead of awaiting it"""
+    if logger.isEnabledFor(INFO):
+        logger.info("%r", (args, kwargs))
@@ -1,7 +1,7 @@
 from aminoacid import Bot
 from aminoacid.abc import Context
 
-import random
+from random import randrange
 
 client = Bot(
     prefix="b!",
@@ -12,7 +12,7 @@ client = Bot(
 
 @client.command()
 async def roll(ctx: Context):
-    await ctx.send(f"You rolled a {random.randint(1, 6)}")
+    await ctx.send(f"You rolled a {randrange(1, 7)}")
 
 
 @client.event()
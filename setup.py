@@ -29,5 +29,6 @@ with open("README.md") as readme:
         ],
         keywords="amino, internet, bot, async",
         install_requires=INSTALL_REQUIRES,
+        extras_require={"speed": ["orjson", "uvloop", "brotli"]},
         packages=find_packages(),
     )